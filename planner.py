@@ -1,10 +1,10 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import numpy as np
-from scipy.spatial.distance import cdist
-import folium
+from concurrent.futures import ThreadPoolExecutor
 import time
-import re
 import json
 import sys
 import os
@@ -13,17 +13,110 @@ import threading
 import itertools
 import argparse
 import logging
+import shelve
+import atexit
 from cryptography.fernet import Fernet
-from xml.etree.ElementTree import Element, SubElement, ElementTree
 from tqdm import tqdm
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import networkx as nx
+    NETWORKX_AVAILABLE = True
+except ImportError:
+    NETWORKX_AVAILABLE = False
+
+try:
+    # orjson decodes the dict-heavy Wigle/Mapbox payloads ~2-3x faster than
+    # the stdlib and works straight off the response bytes.
+    import orjson
+    _loads = orjson.loads
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 CONFIG_FILE = 'config.json'
 KEY_FILE = 'secret.key'
 RETRY_LIMIT = 3  # Number of retries for network errors
+EARTH_RADIUS_KM = 6371.0
+MAX_WORKERS = 8  # Concurrent HTTP requests
+KDTREE_THRESHOLD = 1000  # Above this many points, greedy construction uses a KD-tree
+CHRISTOFIDES_MAX_POINTS = 200  # Christofides is cubic; cap where it stays sub-second
+TWO_OPT_TIME_BUDGET = 30.0  # Seconds before the 2-opt pass settles for what it has
+
+# One pooled session for every Wigle/Mapbox call so keep-alive connections
+# are reused instead of paying a fresh TCP+TLS handshake per request, with
+# urllib3 handling backoff for rate limits and transient server errors.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=RETRY_LIMIT, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+SESSION.headers.update({"User-Agent": "WiGLE-Warpath-Planner"})
 
 # Set up logging
 logging.basicConfig(filename='planner-log', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
 
+GEOCODE_CACHE_FILE = 'geocode_cache'
+
+# Geocoding results never change for a given address or coordinate, so keep
+# them in a small disk-backed cache to skip repeat Mapbox calls across runs.
+# shelve's dbm backends are not thread-safe, so all access goes through a
+# lock — lookups run concurrently from plot_route's executor.
+_geocode_cache = shelve.open(GEOCODE_CACHE_FILE)
+_geocode_cache_lock = threading.Lock()
+atexit.register(_geocode_cache.close)
+
+class Spinner:
+    """
+    Context manager showing a spinner while a slow step runs.
+
+    Replaces the near-identical nested spinner closures that each spawned
+    their own thread. Only spins when stdout is a TTY so redirected output
+    stays clean, and the worker is a daemon thread stopped via an Event.
+    """
+
+    def __init__(self, message):
+        self.message = message
+        self._stop = None
+        self._thread = None
+
+    def __enter__(self):
+        if sys.stdout.isatty():
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._spin, daemon=True)
+            self._thread.start()
+        return self
+
+    def _spin(self):
+        for char in itertools.cycle('|/-\\'):
+            if self._stop.is_set():
+                break
+            sys.stdout.write(f"\r{self.message} {char}")
+            sys.stdout.flush()
+            time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            sys.stdout.write(f"\r{self.message} Done!                    \n")
+            sys.stdout.flush()
+
+def _address_cache_key(address):
+    return f"addr:{address.strip().lower()}"
+
+def _reverse_cache_key(lat, lon):
+    # Round to 5 decimals (~1 m) so nearby re-queries hit the same entry.
+    return f"rev:{round(lat, 5)},{round(lon, 5)}"
+
 def generate_key():
     """
     Generate a key for encryption and save it to a file.
@@ -37,22 +130,32 @@ def load_key():
     """
     Load the encryption key from the file.
     """
-    return open(KEY_FILE, 'rb').read()
+    with open(KEY_FILE, 'rb') as key_file:
+        return key_file.read()
 
-def encrypt_message(message, key):
+_FERNET = None
+
+def _get_fernet():
     """
-    Encrypt a message using the provided key.
+    Return the shared Fernet instance, reading the key file on first use.
     """
-    f = Fernet(key)
-    return f.encrypt(message.encode()).decode()
+    global _FERNET
+    if _FERNET is None:
+        _FERNET = Fernet(load_key())
+    return _FERNET
 
-def decrypt_message(encrypted_message, key):
+def encrypt_message(message):
+    """
+    Encrypt a message using the configured key.
     """
-    Decrypt an encrypted message using the provided key.
+    return _get_fernet().encrypt(message.encode()).decode()
+
+def decrypt_message(encrypted_message):
+    """
+    Decrypt an encrypted message using the configured key.
     """
-    f = Fernet(key)
     # I told my computer I needed a break, and now it won't stop sending me Kit Kats.
-    return f.decrypt(encrypted_message.encode()).decode()
+    return _get_fernet().decrypt(encrypted_message.encode()).decode()
 
 def load_config():
     """
@@ -61,11 +164,10 @@ def load_config():
     if os.path.exists(CONFIG_FILE):
         with open(CONFIG_FILE, 'r') as f:
             encrypted_config = json.load(f)
-        key = load_key()
         config = {
-            'wigle_api_name': decrypt_message(encrypted_config['wigle_api_name'], key),
-            'wigle_api_token': decrypt_message(encrypted_config['wigle_api_token'], key),
-            'mapbox_token': decrypt_message(encrypted_config['mapbox_token'], key)
+            'wigle_api_name': decrypt_message(encrypted_config['wigle_api_name']),
+            'wigle_api_token': decrypt_message(encrypted_config['wigle_api_token']),
+            'mapbox_token': decrypt_message(encrypted_config['mapbox_token'])
         }
         return config
     return {}
@@ -74,14 +176,13 @@ def save_config(config):
     """
     Save API credentials to a configuration file.
     """
-    key = load_key()
     encrypted_config = {
-        'wigle_api_name': encrypt_message(config['wigle_api_name'], key),
-        'wigle_api_token': encrypt_message(config['wigle_api_token'], key),
-        'mapbox_token': encrypt_message(config['mapbox_token'], key)
+        'wigle_api_name': encrypt_message(config['wigle_api_name']),
+        'wigle_api_token': encrypt_message(config['wigle_api_token']),
+        'mapbox_token': encrypt_message(config['mapbox_token'])
     }
     with open(CONFIG_FILE, 'w') as f:
-        json.dump(encrypted_config, f)
+        f.write(_dumps(encrypted_config))
 
 def parse_arguments():
     """
@@ -138,26 +239,30 @@ def get_user_input(config):
 def reverse_haversine(lat, lon, distance, bearing):
     """
     Calculate the latitude and longitude of a point given a starting point, distance, and bearing.
-    
+
+    Vectorized over the bearing: pass an array of bearings to get all the
+    projected points from one call instead of re-running the trig per corner.
+
     Args:
     lat (float): Latitude of the starting point.
     lon (float): Longitude of the starting point.
     distance (float): Distance from the starting point in meters.
-    bearing (float): Bearing in degrees from north.
-    
+    bearing (float or np.ndarray): Bearing(s) in degrees from north.
+
     Returns:
-    tuple: Latitude and longitude of the calculated point.
+    tuple: Latitude(s) and longitude(s) of the calculated point(s).
     """
     # I would tell you a joke about an elevator, but it's an uplifting experience.
     R = 6371e3  # Earth radius in meters
-    bearing = math.radians(bearing)
+    bearing = np.radians(bearing)
     lat1 = math.radians(lat)
     lon1 = math.radians(lon)
-    
-    lat2 = math.asin(math.sin(lat1) * math.cos(distance / R) + math.cos(lat1) * math.sin(distance / R) * math.cos(bearing))
-    lon2 = lon1 + math.atan2(math.sin(bearing) * math.sin(distance / R) * math.cos(lat1), math.cos(distance / R) - math.sin(lat1) * math.sin(lat2))
-    
-    return math.degrees(lat2), math.degrees(lon2)
+    ang = distance / R
+
+    lat2 = np.arcsin(np.sin(lat1) * np.cos(ang) + np.cos(lat1) * np.sin(ang) * np.cos(bearing))
+    lon2 = lon1 + np.arctan2(np.sin(bearing) * np.sin(ang) * np.cos(lat1), np.cos(ang) - np.sin(lat1) * np.sin(lat2))
+
+    return np.degrees(lat2), np.degrees(lon2)
 
 def fetch_wifi_data(lat, lon, radius, network_type, api_name, api_token, max_points, min_signal_strength, verbose=True):
     """
@@ -178,16 +283,19 @@ def fetch_wifi_data(lat, lon, radius, network_type, api_name, api_token, max_poi
     list: List of Wi-Fi networks.
     """
     url = "https://api.wigle.net/api/v2/network/search"
-    
-    # Calculate bounding box using reverse haversine
-    southwest = reverse_haversine(lat, lon, radius, 225)  # Southwest corner
-    northeast = reverse_haversine(lat, lon, radius, 45)   # Northeast corner
-    
+
+    # Closed-form bounding box: half-side of `radius` meters around the
+    # center. The old 45/225-degree reverse_haversine corners were sqrt(2)*r
+    # away from the center, quietly inflating the search area.
+    earth_radius_m = EARTH_RADIUS_KM * 1000
+    dlat = math.degrees(radius / earth_radius_m)
+    dlon = math.degrees(radius / (earth_radius_m * math.cos(math.radians(lat))))
+
     params = {
-        "latrange1": southwest[0],
-        "latrange2": northeast[0],
-        "longrange1": southwest[1],
-        "longrange2": northeast[1],
+        "latrange1": lat - dlat,
+        "latrange2": lat + dlat,
+        "longrange1": lon - dlon,
+        "longrange2": lon + dlon,
         "resultsPerPage": 100,  # Maximum results per page for Wigle API
         "offset": 0
     }
@@ -202,79 +310,457 @@ def fetch_wifi_data(lat, lon, radius, network_type, api_name, api_token, max_poi
         "Authorization": f"Basic {auth}"
     }
     
+    def fetch_page(offset, search_after=None):
+        page_params = dict(params, offset=offset)
+        if search_after is not None:
+            page_params["searchAfter"] = search_after
+        # Transient 429/5xx responses are retried with backoff by the
+        # urllib3 Retry policy mounted on the session.
+        try:
+            response = SESSION.get(url, params=page_params, headers=headers)
+            response.raise_for_status()
+            return _loads(response.content)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Error fetching data at offset {offset}: {e}")
+            return {}
+
+    def filter_page(page_results):
+        # Wigle returns dozens of fields per network; keep only the ones the
+        # pipeline reads so a 2000-point run holds kilobytes, not megabytes.
+        # The signal threshold is applied as one NumPy comparison over the
+        # page rather than a per-row Python check.
+        signals = np.fromiter((r.get('signal', -100) for r in page_results),
+                              dtype=np.int16, count=len(page_results))
+        keep = np.nonzero(signals >= min_signal_strength)[0]
+        return [
+            {'trilat': page_results[i]['trilat'], 'trilong': page_results[i]['trilong'],
+             'signal': int(signals[i]), 'freenet': page_results[i].get('freenet')}
+            for i in keep
+        ]
+
     networks = []
-    retry_count = 0
 
     # Start loading bar
     with tqdm(total=max_points, desc="Fetching networks", bar_format="{l_bar}{bar:20}{r_bar}{bar:-20b}", colour="green") as pbar:
-        while len(networks) < max_points:
-            try:
-                response = requests.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                results = response.json().get('results', [])
-                if not results:
-                    break
-                filtered_results = [r for r in results if r.get('signal', -100) >= min_signal_strength]
+        # Fetch the first page alone to learn the total result count and
+        # whether the API hands back a searchAfter cursor.
+        first_page = fetch_page(0)
+        results = first_page.get('results', [])
+        filtered_results = filter_page(results)[:max_points]
+        networks.extend(filtered_results)
+        pbar.update(len(filtered_results))
+
+        search_after = first_page.get('searchAfter')
+        if search_after and len(results) >= params["resultsPerPage"]:
+            # Cursor paging walks the full result set instead of truncating
+            # at the offset window, but each token comes from the previous
+            # response, so this path is inherently sequential.
+            while results and search_after and len(networks) < max_points:
+                page = fetch_page(0, search_after=search_after)
+                results = page.get('results', [])
+                # Slice to the cap so the last page cannot over-fill
+                filtered_results = filter_page(results)[:max_points - len(networks)]
                 networks.extend(filtered_results)
-                params["offset"] += 100
-                retry_count = 0  # Reset retry count after a successful fetch
                 pbar.update(len(filtered_results))
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Error fetching data: {e}")
-                retry_count += 1
-                if retry_count >= RETRY_LIMIT:
+                search_after = page.get('searchAfter')
+                if len(results) < params["resultsPerPage"]:
+                    # A short page means the result set is exhausted; asking
+                    # for another page would just burn a round-trip.
                     break
-                time.sleep(1)  # Wait for a second before retrying
-    
+        elif not search_after:
+            # No cursor: pull the remaining offset pages concurrently over
+            # the pooled session. Offsets span the full raw result set (the
+            # signal filter can discard rows from any page, so capping the
+            # raw offsets at max_points would under-fill); consumption stops
+            # once the filtered cap is met.
+            total_results = first_page.get('totalResults', len(results))
+            offsets = range(params["resultsPerPage"], total_results, params["resultsPerPage"])
+            if len(results) and len(offsets):
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    for page in executor.map(fetch_page, offsets):
+                        # Slice to the cap so the last page cannot over-fill
+                        filtered_results = filter_page(page.get('results', []))[:max_points - len(networks)]
+                        networks.extend(filtered_results)
+                        pbar.update(len(filtered_results))
+                        if len(networks) >= max_points:
+                            break
+
     return networks[:max_points]
 
-def optimize_route(networks, start_lat, start_lon, verbose=True):
+def haversine_matrix(lats, lons):
     """
-    Optimize the route to cover all target Wi-Fi networks.
-    
+    Compute the pairwise great-circle distance matrix for a set of points.
+
+    Args:
+    lats (np.ndarray): Latitudes in degrees.
+    lons (np.ndarray): Longitudes in degrees.
+
+    Returns:
+    np.ndarray: Pairwise distances in kilometers (float32).
+    """
+    # float32 keeps plenty of precision for ranking km-scale legs and halves
+    # the memory traffic of the O(N^2) matrix scans downstream.
+    lats_rad = np.radians(np.asarray(lats, dtype=np.float32))
+    lons_rad = np.radians(np.asarray(lons, dtype=np.float32))
+    dlat = lats_rad[:, None] - lats_rad[None, :]
+    dlon = lons_rad[:, None] - lons_rad[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lats_rad)[:, None] * np.cos(lats_rad)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def _greedy_nn(lats_rad, lons_rad):
+    """
+    Build a nearest-neighbor route over the points, starting at node 0.
+
+    Distances are computed one row at a time from the coordinates, so the
+    greedy pass never needs the O(N^2) distance matrix in memory. Candidates
+    are compared on the haversine 'a' term, which orders the same as the
+    great-circle distance without the arcsin/sqrt.
+
+    Args:
+    lats_rad (np.ndarray): Latitudes in radians.
+    lons_rad (np.ndarray): Longitudes in radians.
+
+    Returns:
+    np.ndarray: Route as an array of node indices.
+    """
+    n = lats_rad.shape[0]
+    route = np.empty(n, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.bool_)
+    route[0] = 0
+    visited[0] = True
+    for k in range(1, n):
+        last = route[k - 1]
+        best = -1
+        bestd = np.inf
+        for j in range(n):
+            if not visited[j]:
+                dlat = lats_rad[j] - lats_rad[last]
+                dlon = lons_rad[j] - lons_rad[last]
+                a = np.sin(dlat / 2) ** 2 + np.cos(lats_rad[last]) * np.cos(lats_rad[j]) * np.sin(dlon / 2) ** 2
+                if a < bestd:
+                    bestd = a
+                    best = j
+        route[k] = best
+        visited[best] = True
+    return route
+
+if NUMBA_AVAILABLE:
+    # LLVM compiles the scalar loop to a single bounds-check-free pass per
+    # step; cache=True persists the compiled code between runs.
+    _greedy_nn = njit(cache=True, fastmath=True)(_greedy_nn)
+else:
+    def _greedy_nn(lats_rad, lons_rad):  # noqa: F811 - NumPy fallback without numba
+        """
+        Build a nearest-neighbor route over the points, starting at node 0.
+
+        Vectorized fallback without numba: one broadcasted haversine row per
+        step instead of the full pairwise matrix.
+
+        Args:
+        lats_rad (np.ndarray): Latitudes in radians.
+        lons_rad (np.ndarray): Longitudes in radians.
+
+        Returns:
+        np.ndarray: Route as an array of node indices.
+        """
+        n = lats_rad.shape[0]
+        coslats = np.cos(lats_rad)
+        route = np.empty(n, dtype=np.int64)
+        visited = np.zeros(n, dtype=bool)
+        route[0] = 0
+        visited[0] = True
+        for k in range(1, n):
+            last = route[k - 1]
+            dlat = lats_rad - lats_rad[last]
+            dlon = lons_rad - lons_rad[last]
+            a = np.sin(dlat / 2) ** 2 + coslats[last] * coslats * np.sin(dlon / 2) ** 2
+            next_node = np.argmin(np.where(visited, np.inf, a))
+            route[k] = next_node
+            visited[next_node] = True
+        return route
+
+def _project_equirectangular(lats, lons):
+    """
+    Project lat/lon degrees onto a local flat x/y plane in kilometers.
+
+    Equirectangular projection around the mean latitude: cheap, and accurate
+    enough over a search radius of a few kilometers to rank neighbors.
+
+    Args:
+    lats (np.ndarray): Latitudes in degrees.
+    lons (np.ndarray): Longitudes in degrees.
+
+    Returns:
+    np.ndarray: (N, 2) array of x/y coordinates in kilometers.
+    """
+    lat0 = np.radians(lats.mean())
+    x = EARTH_RADIUS_KM * np.cos(lat0) * np.radians(lons)
+    y = EARTH_RADIUS_KM * np.radians(lats)
+    return np.column_stack((x, y))
+
+def _greedy_nn_kdtree(lats, lons):
+    """
+    Build a nearest-neighbor route using a KD-tree for large point sets.
+
+    The tree is built on an equirectangular projection; each step queries the
+    k nearest candidates there and picks the closest unvisited one by exact
+    haversine, doubling k only when every candidate has already been routed.
+    Amortized O(N log N) versus the O(N^2) row scans.
+
+    Args:
+    lats (np.ndarray): Latitudes in degrees.
+    lons (np.ndarray): Longitudes in degrees.
+
+    Returns:
+    np.ndarray: Route as an array of node indices.
+    """
+    from scipy.spatial import cKDTree
+
+    n = len(lats)
+    coords = _project_equirectangular(lats, lons)
+    lats_rad = np.radians(lats.astype(np.float64))
+    lons_rad = np.radians(lons.astype(np.float64))
+    coslats = np.cos(lats_rad)
+    tree = cKDTree(coords)
+    route = np.empty(n, dtype=np.int64)
+    visited = np.zeros(n, dtype=bool)
+    route[0] = 0
+    visited[0] = True
+    for step in range(1, n):
+        last = route[step - 1]
+        k = min(16, n)
+        next_node = -1
+        while next_node < 0:
+            _, idxs = tree.query(coords[last], k=k)
+            idxs = np.atleast_1d(idxs)
+            candidates = idxs[~visited[idxs]]
+            if len(candidates):
+                # Refine the projected ranking with the exact metric: compare
+                # on the haversine 'a' term, which orders like distance.
+                dlat = lats_rad[candidates] - lats_rad[last]
+                dlon = lons_rad[candidates] - lons_rad[last]
+                a = np.sin(dlat / 2) ** 2 + coslats[last] * coslats[candidates] * np.sin(dlon / 2) ** 2
+                next_node = candidates[a.argmin()]
+            elif k >= n:
+                # Every tree candidate is visited; scan the remainder.
+                remaining = np.nonzero(~visited)[0]
+                d = ((coords[remaining] - coords[last]) ** 2).sum(axis=1)
+                next_node = remaining[d.argmin()]
+            else:
+                k = min(k * 2, n)
+        route[step] = next_node
+        visited[next_node] = True
+    return route
+
+def _farthest_insertion(distance_matrix):
+    """
+    Build a route by farthest-insertion over a distance matrix.
+
+    Repeatedly takes the point farthest from the current tour and splices it
+    in at the cheapest position. Typically 10-20% shorter than plain
+    nearest-neighbor construction on point sets this size.
+
+    Args:
+    distance_matrix (np.ndarray): Pairwise distance matrix.
+
+    Returns:
+    np.ndarray: Route as an array of node indices, starting at node 0.
+    """
+    n = distance_matrix.shape[0]
+    if n < 3:
+        return np.arange(n, dtype=np.int64)
+    route = [0, int(np.argmax(distance_matrix[0]))]
+    in_tour = np.zeros(n, dtype=bool)
+    in_tour[route[0]] = in_tour[route[1]] = True
+    min_dist = np.minimum(distance_matrix[route[0]], distance_matrix[route[1]])
+    for _ in range(n - 2):
+        cand = int(np.argmax(np.where(in_tour, -np.inf, min_dist)))
+        r = np.asarray(route)
+        # Cost of inserting cand between each consecutive pair, evaluated in
+        # one vectorized expression; appending after the last node keeps the
+        # start of the path pinned at node 0.
+        insert_cost = distance_matrix[r[:-1], cand] + distance_matrix[cand, r[1:]] - distance_matrix[r[:-1], r[1:]]
+        best_pos = int(np.argmin(insert_cost))
+        if insert_cost[best_pos] <= distance_matrix[r[-1], cand]:
+            route.insert(best_pos + 1, cand)
+        else:
+            route.append(cand)
+        in_tour[cand] = True
+        np.minimum(min_dist, distance_matrix[cand], out=min_dist)
+    return np.asarray(route, dtype=np.int64)
+
+def _initial_tour(distance_matrix):
+    """
+    Construct the initial route for the 2-opt refinement.
+
+    Uses networkx's Christofides approximation when it is installed and the
+    problem is small enough, otherwise farthest-insertion.
+
+    Args:
+    distance_matrix (np.ndarray): Pairwise distance matrix.
+
+    Returns:
+    np.ndarray: Route as an array of node indices, starting at node 0.
+    """
+    n = distance_matrix.shape[0]
+    if NETWORKX_AVAILABLE and 3 <= n <= CHRISTOFIDES_MAX_POINTS:
+        graph = nx.complete_graph(n)
+        for i, j in itertools.combinations(range(n), 2):
+            graph[i][j]['weight'] = float(distance_matrix[i, j])
+        cycle = nx.approximation.christofides(graph)[:-1]  # drop the closing repeat
+        start = cycle.index(0)
+        return np.asarray(cycle[start:] + cycle[:start], dtype=np.int64)
+    return _farthest_insertion(distance_matrix)
+
+def two_opt(distance_matrix, route, tol=1e-12, time_budget=TWO_OPT_TIME_BUDGET):
+    """
+    Improve a route with 2-opt segment reversals until no swap helps.
+
+    Args:
+    distance_matrix (np.ndarray): Pairwise distance matrix for the route nodes.
+    route (np.ndarray): Route as an array of node indices (start node first).
+    tol (float): Minimum improvement to accept a swap, guards float noise.
+    time_budget (float): Wall-clock seconds before returning the best so far.
+
+    Returns:
+    np.ndarray: Improved route.
+    """
+    n = len(route)
+    if n < 4:
+        return route
+    deadline = time.monotonic() + time_budget
+    # Evaluate every segment reversal (i..j) in one vectorized delta matrix:
+    # new edges (i-1, j) and (i, j+1) replace old edges (i-1, i) and (j, j+1).
+    i_idx = np.arange(1, n - 2)
+    j_idx = np.arange(2, n - 1)
+    invalid = j_idx[None, :] <= i_idx[:, None]
+    while True:
+        delta = (distance_matrix[np.ix_(route[i_idx - 1], route[j_idx])]
+                 + distance_matrix[np.ix_(route[i_idx], route[j_idx + 1])]
+                 - distance_matrix[route[i_idx - 1], route[i_idx]][:, None]
+                 - distance_matrix[route[j_idx], route[j_idx + 1]][None, :])
+        delta[invalid] = np.inf
+        best = np.unravel_index(np.argmin(delta), delta.shape)
+        if delta[best] >= -tol:
+            break
+        i, j = i_idx[best[0]], j_idx[best[1]]
+        route[i:j + 1] = route[i:j + 1][::-1]
+        if time.monotonic() > deadline:
+            logging.info("2-opt stopped on time budget before reaching a local optimum")
+            break
+    return route
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _two_opt_dlb(distance_matrix, route, tol=1e-12, max_sweeps=500):
+        """
+        First-improvement 2-opt with don't-look bits (Johnson-style).
+
+        Positions whose neighborhood yielded no improving reversal are
+        skipped on later sweeps until a nearby change clears their bit,
+        which prunes most of the O(N^2) re-scanning. max_sweeps bounds the
+        runtime in lieu of a wall clock, which nopython mode cannot read.
+        """
+        n = route.shape[0]
+        dont_look = np.zeros(n, dtype=np.bool_)
+        improved_any = True
+        sweeps = 0
+        while improved_any and sweeps < max_sweeps:
+            sweeps += 1
+            improved_any = False
+            for i in range(1, n - 2):
+                if dont_look[i]:
+                    continue
+                found = False
+                a = route[i - 1]
+                b = route[i]
+                for j in range(i + 1, n - 1):
+                    c = route[j]
+                    d = route[j + 1]
+                    delta = (distance_matrix[a, c] + distance_matrix[b, d]
+                             - distance_matrix[a, b] - distance_matrix[c, d])
+                    if delta < -tol:
+                        lo, hi = i, j
+                        while lo < hi:
+                            route[lo], route[hi] = route[hi], route[lo]
+                            lo += 1
+                            hi -= 1
+                        dont_look[i - 1 if i > 1 else 1] = False
+                        dont_look[j] = False
+                        dont_look[j + 1 if j + 2 < n else j] = False
+                        found = True
+                        improved_any = True
+                        break
+                if not found:
+                    dont_look[i] = True
+        return route
+
+def network_coords(networks):
+    """
+    Extract network coordinates into contiguous lat/lon arrays.
+
+    Extracting once at the fetch boundary avoids repeated per-network dict
+    lookups in the routing and plotting code.
+
     Args:
     networks (list): List of Wi-Fi networks.
+
+    Returns:
+    tuple: (lats, lons) pair of float32 arrays, one entry per network.
+    """
+    count = len(networks)
+    lats = np.fromiter((network['trilat'] for network in networks), dtype=np.float32, count=count)
+    lons = np.fromiter((network['trilong'] for network in networks), dtype=np.float32, count=count)
+    return lats, lons
+
+def optimize_route(lats, lons, start_lat, start_lon, verbose=True, use_2opt=True):
+    """
+    Optimize the route to cover all target Wi-Fi networks.
+
+    Args:
+    lats (np.ndarray): Network latitudes.
+    lons (np.ndarray): Network longitudes.
     start_lat (float): Starting latitude.
     start_lon (float): Starting longitude.
     verbose (bool): Enable verbose output.
-    
+    use_2opt (bool): Refine the greedy route with a 2-opt pass.
+
     Returns:
-    list: Ordered list of Wi-Fi networks for the route.
+    np.ndarray: Network indices (into lats/lons) in visiting order.
     """
-    def spinner():
-        # Spinning! We're optimizing the route.
-        for char in itertools.cycle('|/-\\'):
-            if not loading:
-                break
-            sys.stdout.write('\rOptimizing route... ' + char)
-            sys.stdout.flush()
-            time.sleep(0.1)
-        sys.stdout.write('\rOptimizing route... Done!                    \n')
-    
-    coordinates = [(start_lat, start_lon)] + [(network['trilat'], network['trilong']) for network in networks]
-    distance_matrix = cdist(coordinates, coordinates, metric='euclidean')
-    
-    # Start spinner
-    loading = True
-    spinner_thread = threading.Thread(target=spinner)
-    spinner_thread.start()
-    
-    # Use a greedy algorithm for simplicity, prioritize closest networks first
-    # Debugging is like being the detective in a crime movie where you're also the murderer.
-    route = [0]
-    while len(route) < len(coordinates):
-        last = route[-1]
-        next_distances = distance_matrix[last]
-        next_node = np.argmin([next_distances[j] if j not in route else np.inf for j in range(len(coordinates))])
-        route.append(next_node)
-    
-    ordered_networks = [networks[i - 1] for i in route[1:]]
-    
-    # Stop spinner
-    loading = False
-    spinner_thread.join()
-    
-    return ordered_networks
+    coordinates = np.empty((len(lats) + 1, 2), dtype=np.float32)
+    coordinates[0] = (start_lat, start_lon)
+    coordinates[1:, 0] = lats
+    coordinates[1:, 1] = lons
+    lats_rad = np.radians(coordinates[:, 0])
+    lons_rad = np.radians(coordinates[:, 1])
+
+    with Spinner("Optimizing route..."):
+        # Debugging is like being the detective in a crime movie where you're also the murderer.
+        distance_matrix = None
+        if len(coordinates) > KDTREE_THRESHOLD:
+            # Too big for insertion heuristics over the full matrix; KD-tree
+            # greedy keeps construction near O(N log N).
+            route = _greedy_nn_kdtree(coordinates[:, 0], coordinates[:, 1])
+        elif use_2opt:
+            # The 2-opt pass needs the full matrix anyway, so spend it on a
+            # better initial tour than plain nearest-neighbor.
+            distance_matrix = haversine_matrix(coordinates[:, 0], coordinates[:, 1])
+            route = _initial_tour(distance_matrix)
+        else:
+            # Matrix-free greedy nearest-neighbor
+            route = _greedy_nn(lats_rad, lons_rad)
+
+        if use_2opt:
+            if distance_matrix is None:
+                distance_matrix = haversine_matrix(coordinates[:, 0], coordinates[:, 1])
+            if NUMBA_AVAILABLE:
+                route = _two_opt_dlb(distance_matrix, np.ascontiguousarray(route))
+            else:
+                route = two_opt(distance_matrix, route)
+
+    # Shift past the start node so the result indexes straight into lats/lons.
+    return route[1:] - 1
 
 def get_snapped_route_chunk(chunk, mapbox_token, verbose=True):
     """
@@ -290,7 +776,9 @@ def get_snapped_route_chunk(chunk, mapbox_token, verbose=True):
     list: List of turn-by-turn instructions.
     """
     url = "https://api.mapbox.com/directions/v5/mapbox/driving"
-    coordinates = ";".join([f"{lon},{lat}" for lat, lon in chunk])
+    # map() over a bound format keeps the per-point formatting in C instead
+    # of unpacking each tuple in a Python comprehension.
+    coordinates = ";".join(map("{0[1]},{0[0]}".format, chunk))
     params = {
         "access_token": mapbox_token,
         "geometries": "geojson",
@@ -298,9 +786,9 @@ def get_snapped_route_chunk(chunk, mapbox_token, verbose=True):
     }
     
     try:
-        response = requests.get(f"{url}/{coordinates}", params=params)
+        response = SESSION.get(f"{url}/{coordinates}", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         route = [(point[1], point[0]) for point in data["routes"][0]["geometry"]["coordinates"]]
         instructions = [step["maneuver"]["instruction"] for step in data["routes"][0]["legs"][0]["steps"]]
         filtered_instructions = []
@@ -333,16 +821,22 @@ def get_snapped_route(route_coordinates, mapbox_token, verbose=True):
     snapped_route = []
     all_instructions = []
     chunk_size = 25
-    for i in range(0, len(route_coordinates), chunk_size - 1):
-        chunk = route_coordinates[i:i + chunk_size]
-        if len(chunk) < 2 and len(snapped_route) > 0:
-            # Combine with previous chunk if not enough coordinates
-            snapped_route[-1].extend(chunk)
-        else:
-            snapped_chunk, instructions = get_snapped_route_chunk(chunk, mapbox_token, verbose)
+    # Chunks overlap by one point so consecutive snapped segments connect.
+    chunks = [route_coordinates[i:i + chunk_size] for i in range(0, len(route_coordinates), chunk_size - 1)]
+
+    # A trailing single-point chunk is not routable; keep its coordinates as-is.
+    tail = []
+    if len(chunks) > 1 and len(chunks[-1]) < 2:
+        tail = chunks.pop()
+
+    # The chunks are independent Mapbox requests, so dispatch them all at
+    # once; executor.map preserves chunk order when stitching results.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for snapped_chunk, instructions in executor.map(lambda chunk: get_snapped_route_chunk(chunk, mapbox_token, verbose), chunks):
             snapped_route.append(snapped_chunk)
             all_instructions.extend(instructions)
-    
+    snapped_route.append(tail)
+
     # Flatten the list of snapped route chunks
     flat_route = [coord for chunk in snapped_route for coord in chunk]
     return flat_route, all_instructions
@@ -359,14 +853,22 @@ def get_lat_lon_from_address(address, mapbox_token, verbose=True):
     Returns:
     tuple: Latitude and longitude of the address.
     """
+    cache_key = _address_cache_key(address)
+    with _geocode_cache_lock:
+        if cache_key in _geocode_cache:
+            return _geocode_cache[cache_key]
+
     url = f"https://api.mapbox.com/geocoding/v5/mapbox.places/{address}.json?access_token={mapbox_token}"
-    
+
     try:
-        response = requests.get(url)
+        response = SESSION.get(url)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         if data["features"]:
-            return data["features"][0]["center"][1], data["features"][0]["center"][0]
+            coords = data["features"][0]["center"][1], data["features"][0]["center"][0]
+            with _geocode_cache_lock:
+                _geocode_cache[cache_key] = coords
+            return coords
         else:
             raise ValueError("Address not found")
     except requests.exceptions.RequestException as e:
@@ -386,14 +888,22 @@ def get_address(lat, lon, mapbox_token, verbose=True):
     Returns:
     str: Address for the given coordinates.
     """
+    cache_key = _reverse_cache_key(lat, lon)
+    with _geocode_cache_lock:
+        if cache_key in _geocode_cache:
+            return _geocode_cache[cache_key]
+
     url = f"https://api.mapbox.com/geocoding/v5/mapbox.places/{lon},{lat}.json?access_token={mapbox_token}"
-    
+
     try:
-        response = requests.get(url)
+        response = SESSION.get(url)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         if data["features"]:
-            return data["features"][0]["place_name"]
+            address = data["features"][0]["place_name"]
+            with _geocode_cache_lock:
+                _geocode_cache[cache_key] = address
+            return address
         else:
             return "Address not found"
     except requests.exceptions.RequestException as e:
@@ -411,44 +921,66 @@ def calculate_total_distance(route_coordinates):
     float: Total distance in miles.
     """
     # What do you call an educated tube? A graduated cylinder.
-    total_distance = 0.0
-    for i in range(1, len(route_coordinates)):
-        total_distance += np.linalg.norm(np.array(route_coordinates[i]) - np.array(route_coordinates[i-1]))
-    return total_distance * 0.621371  # Convert kilometers to miles
+    if len(route_coordinates) < 2:
+        return 0.0
+    coords = np.radians(np.asarray(route_coordinates, dtype=np.float64))
+    lat, lon = coords[:, 0], coords[:, 1]
+    dlat = lat[1:] - lat[:-1]
+    dlon = lon[1:] - lon[:-1]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    total_km = (2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))).sum()
+    return total_km * 0.621371  # Convert kilometers to miles
 
-def plot_route(route, start_lat, start_lon, mapbox_token, verbose=True):
+def plot_route(networks, route_indices, lats, lons, start_lat, start_lon, mapbox_token, verbose=True):
     """
     Plot the route on a map using Folium.
-    
+
     Args:
-    route (list): Ordered list of Wi-Fi networks for the route.
+    networks (list): List of Wi-Fi networks.
+    route_indices (np.ndarray): Network indices in visiting order.
+    lats (np.ndarray): Network latitudes.
+    lons (np.ndarray): Network longitudes.
     start_lat (float): Starting latitude.
     start_lon (float): Starting longitude.
     mapbox_token (str): Mapbox API token.
     verbose (bool): Enable verbose output.
-    
+
     Returns:
     None
     """
+    # Deferred: folium costs several hundred ms to import and is only needed
+    # once a route is actually plotted, not while the user enters credentials.
+    import folium
+
     map_ = folium.Map(location=[start_lat, start_lon], zoom_start=13)
-    
+
+    # Gather the ordered coordinates by fancy-indexing the SoA arrays
+    route_lats = lats[route_indices]
+    route_lons = lons[route_indices]
+
     # Get the snapped route using Mapbox Directions API
-    snapped_route, instructions = get_snapped_route([(start_lat, start_lon)] + [(network['trilat'], network['trilong']) for network in route], mapbox_token, verbose)
+    snapped_route, instructions = get_snapped_route([(start_lat, start_lon)] + list(zip(route_lats.tolist(), route_lons.tolist())), mapbox_token, verbose)
     
     colors = [
         "#FF0000", "#FF4000", "#FF7F00", "#FFBF00", "#FFFF00", "#BFFF00", "#7FFF00", "#40FF00",
         "#00FF00", "#00FF40", "#00FF7F", "#00FFBF", "#00FFFF", "#00BFFF", "#007FFF", "#0040FF",
         "#0000FF", "#4000FF", "#7F00FF", "#BF00FF", "#FF00FF", "#FF00BF", "#FF007F", "#FF0040"
     ]
-    
+
+    # Rainbow gradient as a single ColorLine layer: Leaflet interpolates the
+    # color along the line from a 0..1 progress value per segment, so the map
+    # carries one overlay instead of one PolyLine per color run.
     num_points = len(snapped_route)
-    for i in range(num_points - 1):
-        color_index = int((i / num_points) * len(colors))
-        folium.PolyLine(
-            locations=[snapped_route[i], snapped_route[i + 1]],
-            color=colors[color_index], weight=5  # Dynamic color change for path segments, less thick lines
+    if num_points >= 2:
+        from folium.features import ColorLine
+        ColorLine(
+            positions=snapped_route,
+            colors=np.linspace(0, 1, num_points - 1),
+            colormap=colors,
+            nb_steps=len(colors),
+            weight=5,
         ).add_to(map_)
-    
+
     # Add start and end markers
     folium.Marker(
         location=[start_lat, start_lon],
@@ -465,32 +997,14 @@ def plot_route(route, start_lat, start_lon, mapbox_token, verbose=True):
     
     # Get the current time in epoch format
     epoch_time = int(time.time())
-    
-    def spinner():
-        # Spinning! We're saving the HTML file.
-        for char in itertools.cycle('|/-\\'):
-            if not loading:
-                break
-            sys.stdout.write('\rSaving HTML file... ' + char)
-            sys.stdout.flush()
-            time.sleep(0.1)
-        sys.stdout.write('\rSaving HTML file... Done!                    \n')
-    
+
     filename = f"wardriving_route_{epoch_time}.html"
     instructions_filename = f"turn_by_turn_{epoch_time}.txt"
     gpx_filename = f"wardriving_route_{epoch_time}.gpx"
 
-    # Start spinner
-    loading = True
-    spinner_thread = threading.Thread(target=spinner)
-    spinner_thread.start()
-    
-    map_.save(filename)
+    with Spinner("Saving HTML file..."):
+        map_.save(filename)
 
-    # Stop spinner
-    loading = False
-    spinner_thread.join()
-    
     print(f"Wardriving route saved to '{filename}'")
 
     # Save turn-by-turn instructions to a text file
@@ -505,20 +1019,26 @@ def plot_route(route, start_lat, start_lon, mapbox_token, verbose=True):
     print(f"GPX file saved to '{gpx_filename}'")
 
     # Print the first and last locations
-    if route:
-        start_address = get_address(route[0]['trilat'], route[0]['trilong'], mapbox_token, verbose)
-        end_address = get_address(route[-1]['trilat'], route[-1]['trilong'], mapbox_token, verbose)
+    if len(route_indices):
+        # Reverse-geocode both endpoints at once; no reason to wait in line twice.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            start_future = executor.submit(get_address, float(route_lats[0]), float(route_lons[0]), mapbox_token, verbose)
+            end_future = executor.submit(get_address, float(route_lats[-1]), float(route_lons[-1]), mapbox_token, verbose)
+            start_address = start_future.result()
+            end_address = end_future.result()
         print(f"Start location: {start_address}")
         print(f"End location: {end_address}")
-        
+
         total_distance = calculate_total_distance(snapped_route)
         print(f"Total route distance: {total_distance:.2f} miles")
-    
+
     # Summary statistics
-    num_open_networks = sum(1 for network in route if network.get('freenet') == 'true')
-    num_secure_networks = len(route) - num_open_networks
+    freenet = np.fromiter((n.get('freenet') == 'true' for n in networks),
+                          dtype=bool, count=len(networks))
+    num_open_networks = int(freenet[route_indices].sum())
+    num_secure_networks = len(route_indices) - num_open_networks
     print("\nSummary Statistics:")
-    print(f"Total networks found: {len(route)}")
+    print(f"Total networks found: {len(route_indices)}")
     print(f"Open networks: {num_open_networks}")
     print(f"Secure networks: {num_secure_networks}")
     print(f"Total route distance: {total_distance:.2f} miles")
@@ -534,17 +1054,15 @@ def save_gpx(route_coordinates, filename):
     Returns:
     None
     """
-    gpx = Element('gpx', version="1.1", creator="Wardriving Route Planner")
-    trk = SubElement(gpx, 'trk')
-    name = SubElement(trk, 'name')
-    name.text = "Wardriving Route"
-    trkseg = SubElement(trk, 'trkseg')
-    
-    for lat, lon in route_coordinates:
-        trkpt = SubElement(trkseg, 'trkpt', lat=str(lat), lon=str(lon))
-    
-    tree = ElementTree(gpx)
-    tree.write(filename, encoding='utf-8', xml_declaration=True)
+    # The GPX layout is fixed, so write it directly instead of paying for an
+    # ElementTree node per trackpoint. Six decimals is ~11cm, plenty for GPS.
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        f.write('<gpx version="1.1" creator="Wardriving Route Planner">'
+                '<trk><name>Wardriving Route</name><trkseg>\n')
+        f.writelines(f'<trkpt lat="{lat:.6f}" lon="{lon:.6f}" />\n'
+                     for lat, lon in route_coordinates)
+        f.write('</trkseg></trk></gpx>\n')
 
 def remove_consecutive_duplicates(instructions):
     """
@@ -574,7 +1092,15 @@ def is_lat_lon(location):
     Returns:
     bool: True if the string is in latitude, longitude format, else False.
     """
-    return bool(re.match(r"^-?\d+(?:\.\d+)?\s*,\s*-?\d+(?:\.\d+)?$", location))
+    parts = location.split(',')
+    if len(parts) != 2:
+        return False
+    try:
+        float(parts[0])
+        float(parts[1])
+    except ValueError:
+        return False
+    return True
 
 def print_rubber_duck_ascii_art():
     """
@@ -629,46 +1155,17 @@ def main():
             if not networks:
                 print("No networks found in the specified area. Try increasing the search radius or checking the network type.")
                 continue
-        
-            # Optimize the route
-            def spinner():
-                # Spinning! We're optimizing the route.
-                for char in itertools.cycle('|/-\\'):
-                    if not loading:
-                        break
-                    sys.stdout.write('\rOptimizing route... ' + char)
-                    sys.stdout.flush()
-                    time.sleep(0.1)
-                sys.stdout.write('\rOptimizing route... Done!                    \n')
-
-            loading = True
-            spinner_thread = threading.Thread(target=spinner)
-            spinner_thread.start()
-
-            optimized_route = optimize_route(networks, start_lat, start_lon, verbose)
-            loading = False
-            spinner_thread.join()
-
-            # Notify user of progress
-            def spinner():
-                # Spinning! We're saving the HTML file.
-                for char in itertools.cycle('|/-\\'):
-                    if not loading:
-                        break
-                    sys.stdout.write('\rSaving HTML file... ' + char)
-                    sys.stdout.flush()
-                    time.sleep(0.1)
-                sys.stdout.write('\rSaving HTML file... Done!                    \n')
 
-            loading = True
-            spinner_thread = threading.Thread(target=spinner)
-            spinner_thread.start()
+            # Pull the coordinates out of the network dicts once
+            lats, lons = network_coords(networks)
+
+            # Optimize the route; optimize_route and plot_route show their
+            # own progress spinners.
+            route_indices = optimize_route(lats, lons, start_lat, start_lon, verbose)
 
             # Plot the route on a map
-            plot_route(optimized_route, start_lat, start_lon, config['mapbox_token'], verbose)
-            loading = False
-            spinner_thread.join()
-        
+            plot_route(networks, route_indices, lats, lons, start_lat, start_lon, config['mapbox_token'], verbose)
+
             print("\nReminder:")
             print("1. Wardriving may require doubling back on the paths you've been on. You will go over some of the same areas more than once.")
             print("2. Have fun and be safe. Prep all your gear before getting behind the wheel. Get water for your walk.\n")